@@ -21,8 +21,10 @@ use serde::Serialize;
 
 use std::env::current_dir;
 use std::fs;
+use std::panic;
 use std::path::{Path, PathBuf};
 use std::sync::{Arc, Mutex};
+use std::thread::JoinHandle;
 
 #[derive(Parser, Debug, Serialize, Clone)]
 pub struct ApplyArgs {
@@ -36,34 +38,26 @@ impl ApplyArgs {
         let workspace_root = current_dir()?;
         let config = self.config.clone().with_workspace_config(workspace_root)?;
 
-        // Verify required fields such es `license`, `owner` and `format` are set.
-        Self::check_required_fields(&config);
-
-        let args = serde_json::to_value(config);
-        if let Err(err) = args.as_ref() {
-            error::serialize_args_error("apply", err)
-        }
-
-        let config = serde_json::from_value::<LicensaWorkspace>(args.unwrap());
-        if let Err(err) = config.as_ref() {
-            error::deserialize_args_error("apply", err)
-        }
-
-        Ok(config.unwrap())
-    }
-
-    fn check_required_fields(config: &Config) {
-        if config.license.is_none() {
+        // Verify required fields such es `license` and `owner` are set and move
+        // them straight into the workspace config, without a JSON round trip.
+        let Some(license) = config.license else {
             error::missing_required_arg_error("-t, --type <LICENSE>")
-        }
-        if config.owner.is_none() {
+        };
+        let Some(owner) = config.owner else {
             error::missing_required_arg_error("-o, --owner <OWNER>")
-        }
+        };
+
+        Ok(LicensaWorkspace {
+            owner,
+            license,
+            exclude: config.exclude,
+            year: config.year,
+        })
     }
 }
 
 pub fn run(args: &ApplyArgs) -> Result<()> {
-    let mut runner_stats = WorkTreeRunnerStatistics::new("apply", "modified");
+    let runner_stats = WorkTreeRunnerStatistics::new("apply", "modified");
 
     let workspace_root = std::env::current_dir()?;
     let workspace_config = args.to_config()?;
@@ -71,9 +65,9 @@ pub fn run(args: &ApplyArgs) -> Result<()> {
     // ========================================================
     // Scanning process
     // ========================================================
-    let candidates = scan_workspace(&workspace_root, &workspace_config)?;
-
-    runner_stats.set_items(candidates.len());
+    let mut num_items: usize = 0;
+    let (candidates, walk_handle) = scan_workspace(&workspace_root, &workspace_config)?;
+    let candidates = candidates.inspect(|_| num_items += 1);
 
     // ========================================================
     // File processing
@@ -83,10 +77,10 @@ pub fn run(args: &ApplyArgs) -> Result<()> {
 
     let template_engine = handlebars::Handlebars::new();
     let template = template_engine.render_template(SPDX_COPYRIGHT_NOTICE, &workspace_config)?;
-    let template = Arc::new(Mutex::new(template));
+    let template = Arc::new(template);
 
     let context = ScanContext {
-        root: workspace_root,
+        root: Arc::from(workspace_root.as_path()),
         cache: cache.clone(),
         runner_stats: runner_stats.clone(),
         template,
@@ -94,7 +88,12 @@ pub fn run(args: &ApplyArgs) -> Result<()> {
 
     let mut worktree = WorkTree::new();
     worktree.add_task(context, apply_license_notice);
-    worktree.run(candidates);
+    worktree.run(candidates.par_bridge());
+
+    // Surface a panic of the walk thread instead of reporting a partial run
+    walk_handle
+        .join()
+        .unwrap_or_else(|err| panic::resume_unwind(err));
 
     // ========================================================
     // Clear cache
@@ -102,6 +101,7 @@ pub fn run(args: &ApplyArgs) -> Result<()> {
 
     // Print output statistics
     let mut runner_stats = runner_stats.lock().unwrap();
+    runner_stats.set_items(num_items);
     runner_stats.set_status(WorkTreeRunnerStatus::Ok);
     runner_stats.print(true);
 
@@ -110,10 +110,14 @@ pub fn run(args: &ApplyArgs) -> Result<()> {
 
 #[derive(Clone)]
 struct ScanContext {
-    pub root: PathBuf,
+    // Shared rather than owned, since the context is cloned for every split
+    // of the parallel work tree.
+    pub root: Arc<Path>,
     pub runner_stats: Arc<Mutex<WorkTreeRunnerStatistics>>,
     pub cache: Arc<Cache<HeaderTemplate>>,
-    pub template: Arc<Mutex<String>>,
+    // The rendered notice is never mutated after creation, so it is shared
+    // without a lock to let workers compile headers concurrently.
+    pub template: Arc<String>,
 }
 
 #[derive(Debug, Clone)]
@@ -129,7 +133,10 @@ impl Cachable for HeaderTemplate {
 }
 
 // FIXME: Refactor to more generic, re-usable fn
-fn scan_workspace<P>(workspace_root: P, config: &LicensaWorkspace) -> Result<Vec<PathBuf>>
+fn scan_workspace<P>(
+    workspace_root: P,
+    config: &LicensaWorkspace,
+) -> Result<(impl Iterator<Item = PathBuf> + Send, JoinHandle<()>)>
 where
     P: AsRef<Path>,
 {
@@ -138,18 +145,12 @@ where
 
     let mut walker = walk_builder.build()?;
     walker.quit_while(|res| res.is_err());
-    walker.send_while(|res| is_candidate(res.unwrap()));
-
-    let candidates = walker
-        .run_task()
-        .iter()
-        .par_bridge()
-        .into_par_iter()
-        .filter_map(Result::ok)
-        .map(|e| e.path().to_path_buf())
-        .collect::<Vec<PathBuf>>();
-
-    Ok(candidates)
+    walker.send_while(|res| res.as_ref().is_ok_and(is_candidate));
+
+    let (rx, handle) = walker.spawn_task();
+    let candidates = rx.into_iter().filter_map(Result::ok).map(|e| e.into_path());
+
+    Ok((candidates, handle))
 }
 
 fn apply_license_notice(context: &mut ScanContext, response: &FileTaskResponse) -> Result<()> {
@@ -165,7 +166,7 @@ fn apply_license_notice(context: &mut ScanContext, response: &FileTaskResponse)
 
     let file_path = &response
         .path
-        .strip_prefix(&context.root)
+        .strip_prefix(&*context.root)
         .unwrap()
         .to_str()
         .unwrap();
@@ -183,23 +184,25 @@ where
     H: AsRef<str>,
     F: AsRef<str>,
 {
-    let template = header.as_ref().as_bytes().to_vec();
+    let template = header.as_ref().as_bytes();
     let file_content = file_content.as_ref().as_bytes();
-    let mut line = extract_hash_bang(file_content).unwrap_or_default();
-    let mut content = file_content.to_vec();
+    let line = extract_hash_bang(file_content).unwrap_or_default();
 
     let line_break = b'\n';
 
+    // Assemble the output in a single pre-sized buffer
+    let mut content = Vec::with_capacity(line.len() + 1 + template.len() + file_content.len());
+
     if !line.is_empty() {
-        content = content.split_off(line.len());
+        content.extend_from_slice(&line);
         if line[line.len() - 1] != line_break {
-            line.push(line_break);
+            content.push(line_break);
         }
-        content = [line, template, content].concat();
-    } else {
-        content = [template, content].concat();
     }
 
+    content.extend_from_slice(template);
+    content.extend_from_slice(&file_content[line.len()..]);
+
     content
 }
 
@@ -210,24 +213,21 @@ fn resolve_header_template(
     // FIXME: Compute cache id in FileTree
     let cache_id = get_path_suffix(&task.path);
 
-    // Reuse cached template for this candidate
-    if !context.cache.contains(&cache_id) {
-        // Compile and cache template for this candidate
-
+    // Reuse cached template for this candidate, or compile and cache it
+    context.cache.get_or_insert_with(&cache_id, || {
         let header = SourceHeaders::find_header_definition_by_extension(&cache_id).unwrap();
-        let template = context.template.lock().unwrap();
-        let template = template.as_str();
-        let compiled_template = header.header_prefix.apply(template).unwrap();
+        let compiled_template = header
+            .header_prefix
+            .apply(context.template.as_str())
+            .unwrap();
 
         // FIXME: Use unique cache_id for header prefixes to prevent compiling
         // that use the same format.
-        context.cache.add(HeaderTemplate {
+        HeaderTemplate {
             extension: cache_id.clone(),
             template: compiled_template,
-        });
-    }
-
-    context.cache.get(&cache_id).unwrap()
+        }
+    })
 }
 
 fn print_task_success<P>(path: P)
@@ -2,7 +2,7 @@
 // SPDX-License-Identifier: MIT OR Apache-2.0
 
 use crate::config::{
-    Config, {LICENSA_CONFIG_FILENAME, LICENSA_IGNORE_FILENAME},
+    Config, {LICENSA_CONFIG_FILENAME, LICENSA_IGNORE, LICENSA_IGNORE_FILENAME},
 };
 use crate::schema::LicenseId;
 use crate::workspace::ops::{ensure_config_missing, save_config, save_ignore_file};
@@ -10,15 +10,10 @@ use crate::workspace::ops::{ensure_config_missing, save_config, save_ignore_file
 use anyhow::Result;
 use clap::Args;
 use inquire::{Select, Text};
-use lazy_static::lazy_static;
 
 use std::env::current_dir;
 use std::str::FromStr;
 
-lazy_static! {
-    static ref LICENSA_IGNORE: &'static str = std::include_str!("../../.licensaignore");
-}
-
 #[derive(Args, Debug, Clone)]
 pub struct InitArgs {
     #[command(flatten)]
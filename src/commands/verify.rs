@@ -4,7 +4,7 @@
 use crate::config::Config;
 use crate::ops::scan::is_candidate;
 use crate::ops::stats::{WorkTreeRunnerStatistics, WorkTreeRunnerStatus};
-use crate::template::has_copyright_notice;
+use crate::template::{has_copyright_notice, NOTICE_SCAN_LIMIT};
 use crate::workspace::walker::WalkBuilder;
 
 use anyhow::Result;
@@ -13,9 +13,10 @@ use ignore::DirEntry;
 use rayon::prelude::*;
 
 use std::env::current_dir;
-use std::fs;
-use std::path::PathBuf;
-use std::sync::{Arc, Mutex};
+use std::fs::File;
+use std::io::{self, Read};
+use std::panic;
+use std::path::Path;
 
 #[derive(Args, Debug)]
 pub struct VerifyArgs {
@@ -39,51 +40,61 @@ pub fn run(args: &mut VerifyArgs) -> anyhow::Result<()> {
     let mut walker = walk_builder.build()?;
     walker
         .quit_while(|res| res.is_err())
-        .send_while(|res| is_candidate(res.unwrap()))
+        .send_while(|res| res.as_ref().is_ok_and(is_candidate))
         .max_capacity(None);
 
-    let candidates: Vec<DirEntry> = walker
-        .run_task()
-        .iter()
-        .par_bridge()
-        .into_par_iter()
+    let mut num_items: usize = 0;
+    let (candidates, walk_handle) = walker.spawn_task();
+    let candidates = candidates
+        .into_iter()
         .filter_map(Result::ok)
-        .collect();
-
-    runner_stats.set_items(candidates.len());
+        .inspect(|_| num_items += 1);
 
     // ========================================================
     // File processing
     // ========================================================
-    let runner_stats = Arc::new(Mutex::new(runner_stats));
-
-    // Read file as bytes vector and return its content and the patht to it
-    let read_file = |entry: &DirEntry| {
-        fs::read(entry.path())
-            .ok()
-            .map(|content| (content, entry.path().to_path_buf()))
-    };
-
-    // Check existence of copyright notice and update output statistices
-    let check_copyright_notice = |(ref file_contents, ref path): (Vec<u8>, PathBuf)| {
-        let mut runner_stats = runner_stats.lock().unwrap();
-        if has_copyright_notice(file_contents) {
-            runner_stats.add_action_count();
-        } else {
-            runner_stats.add_ignore();
-        }
-    };
-
-    candidates
-        .par_iter()
+    // Read the leading bytes of the file that may contain a copyright notice
+    let read_file = |entry: DirEntry| read_notice_prefix(entry.path()).ok();
+
+    // Check existence of copyright notice and tally the results in a single
+    // reduction, rather than locking the output statistics for every file.
+    let (found, ignored): (usize, usize) = candidates
+        .par_bridge()
         .filter_map(read_file)
-        .for_each(check_copyright_notice);
+        .map(|file_contents| {
+            if has_copyright_notice(&file_contents) {
+                (1, 0)
+            } else {
+                (0, 1)
+            }
+        })
+        .reduce(|| (0, 0), |a, b| (a.0 + b.0, a.1 + b.1));
+
+    // Surface a panic of the walk thread instead of reporting a partial run
+    walk_handle
+        .join()
+        .unwrap_or_else(|err| panic::resume_unwind(err));
+
+    runner_stats.set_items(num_items);
+    runner_stats.set_action_count(found);
+    runner_stats.set_ignored(ignored);
 
     // ========================================================
     // Print output statistics
-    let mut runner_stats = runner_stats.lock().unwrap();
     runner_stats.set_status(WorkTreeRunnerStatus::Ok);
     runner_stats.print(true);
 
     Ok(())
 }
+
+/// Reads at most [NOTICE_SCAN_LIMIT] bytes from the start of the file at `path`.
+///
+/// `has_copyright_notice` never looks past this limit, so there is no need to
+/// read the remainder of the file.
+fn read_notice_prefix<P: AsRef<Path>>(path: P) -> io::Result<Vec<u8>> {
+    let mut content = Vec::with_capacity(NOTICE_SCAN_LIMIT);
+    File::open(path)?
+        .take(NOTICE_SCAN_LIMIT as u64)
+        .read_to_end(&mut content)?;
+    Ok(content)
+}
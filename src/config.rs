@@ -14,6 +14,9 @@ use std::path::Path;
 /// workspace operations.
 pub const LICENSA_IGNORE_FILENAME: &str = ".licensaignore";
 
+/// The default content of a Licensa ignore file, embedded at compile time.
+pub const LICENSA_IGNORE: &str = include_str!("../.licensaignore");
+
 /// The filename used for Licensa's configuration file, which stores
 /// workspace-specific settings and preferences.F
 pub const LICENSA_CONFIG_FILENAME: &str = ".licensarc";
@@ -115,9 +118,11 @@ impl Config {
     }
 
     pub fn update(&mut self, source: Config) {
-        if !source.exclude.is_empty() {
-            let mut patterns = source.exclude;
-            self.exclude.append(&mut patterns);
+        // Overrides are last-match-wins, so a duplicate pattern is moved to the
+        // end rather than skipped, keeping the precedence of the source config.
+        for pattern in source.exclude {
+            self.exclude.retain(|p| p != &pattern);
+            self.exclude.push(pattern);
         }
         if let Some(holder) = source.owner.as_deref() {
             self.owner = Some(holder.to_owned())
@@ -205,6 +210,37 @@ mod tests {
 
     use super::*;
 
+    #[test]
+    fn test_config_update_deduplicates_exclude_patterns() {
+        let mut config = Config {
+            exclude: vec!["*.txt".into(), "target/**".into()],
+            ..Default::default()
+        };
+        let source = Config {
+            exclude: vec!["target/**".into(), "vendor/**".into()],
+            ..Default::default()
+        };
+
+        config.update(source);
+        assert_eq!(config.exclude, vec!["*.txt", "target/**", "vendor/**"]);
+    }
+
+    #[test]
+    fn test_config_update_keeps_source_exclude_precedence() {
+        let mut config = Config {
+            exclude: vec!["vendor/**".into(), "!vendor/keep.rs".into()],
+            ..Default::default()
+        };
+        let source = Config {
+            exclude: vec!["vendor/**".into()],
+            ..Default::default()
+        };
+
+        // The source pattern must still come after the negated pattern
+        config.update(source);
+        assert_eq!(config.exclude, vec!["!vendor/keep.rs", "vendor/**"]);
+    }
+
     #[test]
     fn test_config_invalid_license_year() {
         let config = serde_json::from_value::<Config>(json!({
@@ -16,20 +16,6 @@ where
         .exit()
 }
 
-pub fn deserialize_args_error(cmd: &str, err: &serde_json::Error) -> ! {
-    let err_msg = format!("Failed to deserialize `{cmd}` command arguemnts.\n {}", err);
-    Cli::command()
-        .error(clap::error::ErrorKind::ValueValidation, err_msg)
-        .exit()
-}
-
-pub fn serialize_args_error(cmd: &str, err: &serde_json::Error) -> ! {
-    let err_msg = format!("Failed to serialize `{cmd}` command arguemnts.\n {}", err);
-    Cli::command()
-        .error(clap::error::ErrorKind::ValueValidation, err_msg)
-        .exit()
-}
-
 pub fn exit_invalid_value_err<T>(field: T, value: T, expected: Option<T>)
 where
     T: AsRef<str>,
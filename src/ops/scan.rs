@@ -1,6 +1,7 @@
 // Copyright 2024 Nelson Dominguez
 // SPDX-License-Identifier: MIT OR Apache-2.0
 
+use crate::config::LICENSA_IGNORE_FILENAME;
 use crate::template::header::SourceHeaders;
 use rayon::prelude::*;
 
@@ -12,9 +13,6 @@ use std::path::{Path, PathBuf};
 
 use crate::workspace::walker::{Walk, WalkBuilder};
 
-/// Default filename for the `Licensa` CLI ignore patterns.
-const LICENSA_IGNORE_FILE: &str = ".licensaignore";
-
 /// Configuration for a scan operation.
 #[derive(Debug, Clone)]
 pub struct ScanConfig {
@@ -39,7 +37,7 @@ impl Scan {
     pub fn new(config: ScanConfig) -> Self {
         let exclude = config.exclude.clone().unwrap_or_default();
         let mut walk_builder = WalkBuilder::new(&config.root);
-        walk_builder.add_ignore(LICENSA_IGNORE_FILE);
+        walk_builder.add_ignore(LICENSA_IGNORE_FILENAME);
 
         walk_builder.exclude(Some(exclude)).unwrap();
         let walker = walk_builder.build().unwrap();
@@ -50,7 +48,7 @@ impl Scan {
     pub fn find_candidates(mut self) -> Vec<DirEntry> {
         self.walker.quit_while(|res| res.is_err());
         self.walker
-            .send_while(|res| res.is_ok() && is_candidate(res.unwrap()));
+            .send_while(|res| res.as_ref().is_ok_and(is_candidate));
         self.walker.max_capacity(None);
         self.walker
             .run_task()
@@ -199,12 +197,12 @@ mod tests {
 
         let exclude = config.exclude.clone().unwrap_or_default();
         let mut walk_builder = WalkBuilder::new(&config.root);
-        walk_builder.add_ignore(LICENSA_IGNORE_FILE);
+        walk_builder.add_ignore(LICENSA_IGNORE_FILENAME);
         walk_builder.exclude(Some(exclude)).unwrap();
 
         let mut walker = walk_builder.build().unwrap();
         walker.quit_while(|res| res.is_err());
-        walker.send_while(|res| res.is_ok() && is_candidate(res.unwrap()));
+        walker.send_while(|res| res.as_ref().is_ok_and(is_candidate));
         walker.max_capacity(None);
 
         let result = walker.run_task();
@@ -230,7 +228,7 @@ mod tests {
         let ignored_file_path = root_path.join("ignored.txt");
         File::create(&ignored_file_path).expect("Failed to create ignored file");
 
-        let licensaignore_path = root_path.join(LICENSA_IGNORE_FILE);
+        let licensaignore_path = root_path.join(LICENSA_IGNORE_FILENAME);
         let mut licensaignore_file =
             File::create(&licensaignore_path).expect("Failed to create .licensaignore file");
 
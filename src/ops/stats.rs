@@ -45,6 +45,14 @@ impl WorkTreeRunnerStatistics {
         self.failed += 1;
         self
     }
+    pub fn set_ignored(&mut self, ignored: usize) -> &Self {
+        self.ignored = ignored;
+        self
+    }
+    pub fn set_action_count(&mut self, action_count: usize) -> &Self {
+        self.action_count = action_count;
+        self
+    }
     pub fn set_items(&mut self, num_items: usize) -> &Self {
         self.num_items = num_items;
         self
@@ -217,8 +217,12 @@ impl WorkTree {
     ///
     /// # Arguments
     ///
-    /// * `tree_paths` - A vector of `PathBuf` representing the work tree paths.
-    pub fn run(&self, tree_paths: Vec<PathBuf>) {
+    /// * `tree_paths` - Any parallel iterable of `PathBuf` representing the work tree paths,
+    ///   e.g. a vector, or a bridged channel receiver that is still being fed.
+    pub fn run<I>(&self, tree_paths: I)
+    where
+        I: IntoParallelIterator<Item = PathBuf>,
+    {
         let initial_tasks = self.tasks.clone();
 
         let read_file = |path: PathBuf| {
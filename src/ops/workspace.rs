@@ -1,25 +1,19 @@
 // Copyright 2024 Nelson Dominguez
 // SPDX-License-Identifier: MIT OR Apache-2.0
 
+use crate::config::{LICENSA_CONFIG_FILENAME, LICENSA_IGNORE, LICENSA_IGNORE_FILENAME};
 use crate::utils::{resolve_any_path, verify_dir, write_json};
+use crate::workspace::ops::remove_null_fields;
 
 use anyhow::{anyhow, Result};
-use lazy_static::lazy_static;
 use serde::{Deserialize, Serialize};
-use serde_json::{Map, Value};
+use serde_json::Value;
 
 use std::borrow::Borrow;
 use std::fs;
 use std::path::Path;
 
-lazy_static! {
-    static ref LICENSA_IGNORE: &'static str = std::include_str!("../../.licensaignore");
-}
-
-const LICENSA_IGNORE_FILENAME: &str = ".licensaignore";
-
-const DEFAULT_CONFIG_FILENAME: &str = ".licensarc";
-const POSSIBLE_CONFIG_FILENAMES: &[&str] = &[".licensarc", ".licensarc.json"];
+const POSSIBLE_CONFIG_FILENAMES: &[&str] = &[LICENSA_CONFIG_FILENAME, ".licensarc.json"];
 
 /// Find a Licensa configuration file in the directory specified by `workspace_root`.
 /// If a config file is found, read it and return it's contents.
@@ -130,7 +124,7 @@ where
     verify_dir(workspace_root)?;
     let config = serde_json::to_value(config.borrow())?;
     let config = remove_null_fields(config);
-    let config_path = workspace_root.join(DEFAULT_CONFIG_FILENAME);
+    let config_path = workspace_root.join(LICENSA_CONFIG_FILENAME);
     write_json(config_path, &config)?;
     Ok(())
 }
@@ -190,72 +184,9 @@ where
     Ok(())
 }
 
-/// Recursively removes all fields with `null` values from a JSON object.
-///
-/// This function takes a serde_json Value representing a JSON object and recursively
-/// removes all fields with `null` values. If the input value is not an object or
-/// contains non-object values, it returns the value as is.
-///
-/// # Arguments
-///
-/// * `value` - A serde_json Value representing a JSON object.
-///
-/// # Returns
-///
-/// A serde_json Value with `null` fields removed.
-///
-/// # Examples
-///
-/// ```no_run,ignore
-/// use serde_json::{json, Value};
-/// use licensa::ops::workspace::remove_null_fields;
-///
-/// let json_value = json!({
-///     "name": "John",
-///     "age": null,
-///     "address": {
-///         "city": "New York",
-///         "zip": null
-///     },
-///     "scores": [10, null, 20]
-/// });
-///
-/// let cleaned_value = remove_null_fields(json_value);
-///
-/// assert_eq!(cleaned_value, json!({
-///     "name": "John",
-///     "address": {
-///         "city": "New York"
-///     },
-///     "scores": [10, null, 20]
-/// }));
-/// ```
-pub fn remove_null_fields(value: Value) -> Value {
-    match value {
-        Value::Null => Value::Null,
-        Value::Bool(_) => value,
-        Value::Number(_) => value,
-        Value::String(_) => value,
-        Value::Array(arr) => {
-            let cleaned_array: Vec<Value> = arr.into_iter().map(remove_null_fields).collect();
-            Value::Array(cleaned_array)
-        }
-        Value::Object(obj) => {
-            let mut cleaned_obj: Map<String, Value> = Map::new();
-            for (key, val) in obj {
-                if val != Value::Null {
-                    cleaned_obj.insert(key, remove_null_fields(val));
-                }
-            }
-            Value::Object(cleaned_obj)
-        }
-    }
-}
-
 #[cfg(test)]
 mod tests {
     use super::*;
-    use serde_json::json;
     use std::{fs::File, io::Read};
     use tempfile::tempdir;
 
@@ -269,7 +200,7 @@ mod tests {
     fn test_write_config_file_successful() {
         let temp_dir = tempdir().expect("Failed to create temporary directory");
         let target_dir = temp_dir.path();
-        let config_file_path = target_dir.join(DEFAULT_CONFIG_FILENAME);
+        let config_file_path = target_dir.join(LICENSA_CONFIG_FILENAME);
 
         let sample_config = ExampleWorkspace {
             prop1: "hello world".to_string(),
@@ -315,6 +246,24 @@ mod tests {
         temp_dir.close().expect("Failed to close temp directory");
     }
 
+    #[test]
+    fn test_find_config_file_prefers_first_filename() {
+        let temp_dir = tempdir().expect("Failed to create temporary directory");
+        let target_dir = temp_dir.path();
+
+        // Both config files exist, so the first possible filename must win
+        for filename in POSSIBLE_CONFIG_FILENAMES {
+            fs::write(target_dir.join(filename), filename).expect("Failed to create config file");
+        }
+
+        let result = find_workspace_config(target_dir);
+        assert!(result.is_ok());
+        assert_eq!(result.unwrap(), POSSIBLE_CONFIG_FILENAMES[0]);
+
+        // Cleanup
+        temp_dir.close().expect("Failed to close temp directory");
+    }
+
     #[test]
     fn test_find_config_file_single_file_exists() {
         let temp_dir = tempdir().expect("Failed to create temporary directory");
@@ -364,44 +313,4 @@ mod tests {
         let result: Result<Value> = resolve_workspace_config(target_dir);
         // assert!(result.is_err());
     }
-
-    #[test]
-    fn test_remove_null_fields() {
-        let json_value = json!({
-            "name": "John",
-            "age": null,
-            "address": {
-                "city": "New York",
-                "zip": null
-            },
-            "scores": [10, null, 20]
-        });
-
-        let cleaned_value = remove_null_fields(json_value.clone());
-
-        assert_eq!(
-            cleaned_value,
-            json!({
-                "name": "John",
-                "address": {
-                    "city": "New York"
-                },
-                "scores": [10, null, 20]
-            })
-        );
-
-        // Ensure input value is not modified
-        assert_eq!(
-            json_value,
-            json!({
-                "name": "John",
-                "age": null,
-                "address": {
-                    "city": "New York",
-                    "zip": null
-                },
-                "scores": [10, null, 20]
-            })
-        );
-    }
 }
@@ -67,7 +67,7 @@ impl Serialize for LicenseId {
     where
         S: Serializer,
     {
-        serializer.serialize_str(&self.0.to_string())
+        serializer.serialize_str(&self.0)
     }
 }
 
@@ -168,32 +168,33 @@ impl FromStr for LicenseYear {
     type Err = LicenseYearError;
 
     fn from_str(value: &str) -> Result<Self, Self::Err> {
-        let parts: Vec<&str> = value.split('-').collect();
-
-        if parts.is_empty() {
+        if value.is_empty() {
             return Err(LicenseYearError::EmptyString);
         }
 
-        let num_parts = parts.len();
-        if num_parts > 2 {
+        // Partition on the first separator once, instead of collecting all parts.
+        let (start, end) = match value.split_once('-') {
+            Some((start, end)) => (start, Some(end)),
+            None => (value, None),
+        };
+
+        if end.is_some_and(|end| end.contains('-')) {
             return Err(LicenseYearError::InvalidFormat(value.to_string()));
         }
 
-        let start = parts[0];
         if !is_valid_year(start) {
             return Err(LicenseYearError::InvalidYear(value.to_string()));
         }
         let start: u32 = start.parse().unwrap();
 
-        if num_parts == 1 {
+        let Some(end) = end else {
             return Ok(LicenseYear {
                 end: None,
                 is_present: false,
                 start,
             });
-        }
+        };
 
-        let end = parts[1];
         if end == "present" {
             return Ok(LicenseYear {
                 end: None,
@@ -235,7 +236,7 @@ impl Serialize for LicenseYear {
     where
         S: Serializer,
     {
-        serializer.serialize_str(&self.to_string())
+        serializer.collect_str(self)
     }
 }
 
@@ -345,6 +346,15 @@ mod tests {
         assert!(parsed.is_err());
     }
 
+    #[test]
+    fn test_parse_license_year_invalid_format() {
+        let parsed = LicenseYear::from_str("2020-2021-2022");
+        assert!(matches!(parsed, Err(LicenseYearError::InvalidFormat(_))));
+
+        let parsed = LicenseYear::from_str("");
+        assert!(matches!(parsed, Err(LicenseYearError::EmptyString)));
+    }
+
     #[test]
     fn test_parse_license_year_single_str() {
         let year = "2024";
@@ -387,4 +397,19 @@ mod tests {
         assert!(parsed.is_ok());
         assert_eq!(parsed.unwrap(), expected)
     }
+
+    #[test]
+    fn test_serialize_license_year_and_id() {
+        let year_range = LicenseYear {
+            end: None,
+            is_present: true,
+            start: 2022,
+        };
+        let serialized = serde_json::to_string(&year_range).unwrap();
+        assert_eq!(serialized, format!("\"{}\"", year_range));
+
+        let license_id = LicenseId::from("MIT");
+        let serialized = serde_json::to_string(&license_id).unwrap();
+        assert_eq!(serialized, "\"MIT\"");
+    }
 }
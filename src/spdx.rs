@@ -59,8 +59,10 @@ fn partially_find_license(expr: &str) -> Option<String> {
         .map(|l| l.name.to_string())
 }
 
+#[inline]
 fn is_single_expr(expr: &str) -> bool {
-    expr.split(' ').collect::<Vec<&str>>().len() == 1
+    // Stop at the first separator instead of splitting the whole expression.
+    !expr.contains(' ')
 }
 
 pub fn list_spdx_license_names() -> Vec<String> {
@@ -102,6 +104,13 @@ mod tests {
         assert!(&license_id.unwrap().is_none());
     }
 
+    #[test]
+    fn test_is_single_expr() {
+        assert!(is_single_expr("MIT"));
+        assert!(is_single_expr("Apache-2.0"));
+        assert!(!is_single_expr("MIT OR Apache-2.0"));
+    }
+
     #[test]
     fn test_try_find_by_id_combined() {
         let expr = "mit or apache";
@@ -70,6 +70,40 @@ where
         cache.get(id).cloned()
     }
 
+    /// Retrieves the cached item for the given cache identifier, or caches the
+    /// item produced by `f` if none exists yet.
+    ///
+    /// `f` runs without holding the cache lock, so lookups from other threads
+    /// are not blocked while an item is being built. If another thread caches
+    /// an item with the same id in the meantime, that item is kept and returned.
+    /// Both the lookup and the insertion are keyed by `cache_id`.
+    ///
+    /// # Arguments
+    ///
+    /// * `cache_id` - A string slice representing the cache identifier.
+    /// * `f` - A closure producing the item to cache on a miss.
+    ///
+    /// # Returns
+    ///
+    /// A cloned `Arc<T>` of the cached item.
+    pub fn get_or_insert_with<I, F>(&self, cache_id: I, f: F) -> Arc<T>
+    where
+        I: AsRef<str>,
+        F: FnOnce() -> T,
+    {
+        let id = cache_id.as_ref();
+        if let Some(item) = self.get(id) {
+            return item;
+        }
+
+        let item = f();
+        let mut cache = self.inner.lock().unwrap();
+        cache
+            .entry(id.to_owned())
+            .or_insert_with(|| Arc::new(item))
+            .clone()
+    }
+
     pub fn value(&mut self, item: T) -> Arc<T> {
         let mut cache = self.inner.lock().unwrap();
         let entry = cache.entry(item.cache_id());
@@ -186,6 +220,27 @@ mod tests {
         assert!(cached_template.is_none());
     }
 
+    #[test]
+    fn test_cache_get_or_insert_with_template() {
+        let cache = Cache::<TemplateItem>::new();
+        let extension = ".rs";
+        let template = "Your license template here";
+
+        let cached_template = cache.get_or_insert_with(extension, || TemplateItem {
+            extension: extension.into(),
+            template: template.into(),
+        });
+        assert_eq!(cached_template.template, template);
+
+        // A cached item must not be replaced on subsequent lookups
+        let cached_template = cache.get_or_insert_with(extension, || TemplateItem {
+            extension: extension.into(),
+            template: "Another license template".into(),
+        });
+        assert_eq!(cached_template.template, template);
+        assert_eq!(cache.size(), 1);
+    }
+
     #[test]
     fn test_cache_remove_template() {
         let cache = Cache::<TemplateItem>::new();
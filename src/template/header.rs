@@ -9,6 +9,8 @@
 use anyhow::Result;
 use lazy_static::lazy_static;
 
+use std::collections::HashMap;
+
 lazy_static! {
   /// Represents a predefined list of source header definitions.
   static ref HEADER_DEFINITIONS: Vec<HeaderDefinition<'static>> = vec![
@@ -76,6 +78,18 @@ lazy_static! {
     },
     // TODO: 	handle cmake files
   ];
+
+  /// Maps each file extension to its source header definition for constant-time lookups.
+  static ref HEADER_DEFINITIONS_BY_EXTENSION: HashMap<&'static str, &'static HeaderDefinition<'static>> = {
+    let mut index = HashMap::new();
+    for definition in HEADER_DEFINITIONS.iter() {
+      for &extension in &definition.extensions {
+        // Keep the first definition declaring an extension, as a linear search would.
+        index.entry(extension).or_insert(definition);
+      }
+    }
+    index
+  };
 }
 
 const HEAD: &[&str] = &[
@@ -104,9 +118,9 @@ impl SourceHeaders {
     pub fn find_header_definition_by_extension<'a, E: AsRef<str>>(
         extension: E,
     ) -> Option<&'a HeaderDefinition<'a>> {
-        HEADER_DEFINITIONS
-            .iter()
-            .find(|source| source.contains_extension(Some(&extension)))
+        HEADER_DEFINITIONS_BY_EXTENSION
+            .get(extension.as_ref())
+            .copied()
     }
 
     /// Finds the header prefix based on the given file extension.
@@ -155,14 +169,14 @@ impl<'a> HeaderPrefix<'a> {
     {
         let Self { bottom, mid, top } = &self;
 
-        let mut out = String::new();
+        let template = template.as_ref();
+        let mut out = String::with_capacity(template.len() + top.len() + bottom.len());
         if !top.is_empty() {
             out.push_str(top);
             out.push('\n');
         }
 
-        let lines = template.as_ref().lines();
-        for line in lines {
+        for line in template.lines() {
             out.push_str(mid);
             out.push_str(line.trim_end_matches(char::is_whitespace));
             out.push('\n');
@@ -187,28 +201,23 @@ impl<'a> HeaderPrefix<'a> {
 /// Extracts the hash-bang line from the given byte slice.
 ///
 /// The hash-bang line is the first line in the slice ending with a newline character.
-/// It checks if the lowercase hash-bang line starts with any of the specified prefixes.
+/// It checks if the hash-bang line starts with any of the specified prefixes, ignoring
+/// ASCII case. Only the prefix bytes are compared, so the line is never lowercased as a whole.
 ///
 /// Returns the hash-bang line if a matching prefix is found, otherwise returns `None`.
 pub fn extract_hash_bang(b: &[u8]) -> Option<Vec<u8>> {
-    let mut line = Vec::new();
-
-    for &c in b {
-        line.push(c);
-        if c == b'\n' {
-            break;
-        }
-    }
-
-    let first = String::from_utf8_lossy(&line).to_lowercase();
-
-    for &h in HEAD {
-        if first.starts_with(h) {
-            return Some(line);
-        }
-    }
-
-    None
+    let line_end = b
+        .iter()
+        .position(|&c| c == b'\n')
+        .map_or(b.len(), |pos| pos + 1);
+    let line = &b[..line_end];
+
+    let has_head = HEAD.iter().any(|h| {
+        let h = h.as_bytes();
+        line.len() >= h.len() && line[..h.len()].eq_ignore_ascii_case(h)
+    });
+
+    has_head.then(|| line.to_vec())
 }
 
 #[cfg(test)]
@@ -260,6 +269,19 @@ mod tests {
         assert_eq!(&result, expected);
     }
 
+    #[test]
+    fn test_find_header_definition_by_extension() {
+        for definition in HEADER_DEFINITIONS.iter() {
+            for extension in &definition.extensions {
+                let found = SourceHeaders::find_header_definition_by_extension(extension);
+                assert!(found.is_some_and(|d| d.contains_extension(Some(extension))));
+            }
+        }
+
+        assert!(SourceHeaders::find_header_definition_by_extension(".unknown").is_none());
+        assert!(SourceHeaders::find_header_definition_by_extension("").is_none());
+    }
+
     #[test]
     fn test_hash_bang_with_valid_prefix() {
         // Test with a valid hash-bang line
@@ -287,6 +309,15 @@ mod tests {
         assert_eq!(result, expected);
     }
 
+    #[test]
+    fn test_hash_bang_with_mixed_case_prefix() {
+        // Test with a prefix that differs in case only
+        let input = "<!DOCTYPE html>\n<html></html>".as_bytes();
+        let result = extract_hash_bang(input);
+        let expected = Some(b"<!DOCTYPE html>\n".to_vec());
+        assert_eq!(result, expected);
+    }
+
     #[test]
     fn test_hash_bang_with_empty_input() {
         // Test with an empty input
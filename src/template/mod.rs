@@ -5,6 +5,12 @@ pub mod cache;
 pub mod copyright;
 pub mod header;
 
+use lazy_static::lazy_static;
+use regex::bytes::{Regex, RegexBuilder};
+
+/// The number of leading bytes inspected when looking for a copyright notice.
+pub const NOTICE_SCAN_LIMIT: usize = 1000;
+
 const BREAKWORDS: &[&str] = &[
     "spdx-license-identifier: ",
     "copyright (c)",
@@ -19,23 +25,52 @@ const BREAKWORDS: &[&str] = &[
     "copyright ",
 ];
 
+lazy_static! {
+    /// Matches any of the [BREAKWORDS], ignoring ASCII case, in a single pass.
+    static ref BREAKWORDS_RE: Regex = {
+        let pattern = BREAKWORDS
+            .iter()
+            .map(|w| regex::escape(w))
+            .collect::<Vec<String>>()
+            .join("|");
+
+        RegexBuilder::new(&pattern)
+            .case_insensitive(true)
+            .unicode(false)
+            .build()
+            .unwrap()
+    };
+}
+
 // FIXME: This is a simple, naive attempt to detect licene headers.
 // One improvement would be to only consider breakwords within
 // comment lines.
 pub fn has_copyright_notice(b: &[u8]) -> bool {
-    let n = std::cmp::min(1000, b.len());
-    let lower_b: Vec<u8> = b[..n].iter().map(|&c| c.to_ascii_lowercase()).collect();
-
-    let bytes = BREAKWORDS.iter().map(|w| w.as_bytes());
-
-    for license in bytes {
-        if lower_b
-            .windows(license.len())
-            .any(|window| window == license)
-        {
-            return true;
-        }
+    let n = std::cmp::min(NOTICE_SCAN_LIMIT, b.len());
+    BREAKWORDS_RE.is_match(&b[..n])
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_has_copyright_notice() {
+        let content = b"// Copyright 2024 Bilbo Baggins\n// SPDX-License-Identifier: MIT\n";
+        assert!(has_copyright_notice(content));
+
+        let content = b"/* ALL RIGHTS RESERVED */\nfn main() {}\n";
+        assert!(has_copyright_notice(content));
+
+        let content = b"fn main() {}\n";
+        assert!(!has_copyright_notice(content));
+        assert!(!has_copyright_notice(b""));
     }
 
-    false
+    #[test]
+    fn test_has_copyright_notice_beyond_scan_limit() {
+        let mut content = vec![b' '; NOTICE_SCAN_LIMIT];
+        content.extend_from_slice(b"// Copyright 2024 Bilbo Baggins\n");
+        assert!(!has_copyright_notice(&content));
+    }
 }
@@ -9,10 +9,11 @@ pub mod validate;
 use validate::is_valid_year;
 
 use anyhow::{anyhow, Result};
+use lazy_static::lazy_static;
 
 use std::{
     fs::File,
-    io::Write,
+    io::{BufWriter, Write},
     path::{Path, PathBuf},
     time::{SystemTime, UNIX_EPOCH},
 };
@@ -30,7 +31,17 @@ fn is_leap_year(year: u32) -> bool {
     (year % 4 == 0 && year % 100 != 0) || (year % 400 == 0)
 }
 
+lazy_static! {
+    /// The current year, computed once per process.
+    static ref CURRENT_YEAR: u32 = compute_current_year();
+}
+
+#[inline]
 fn current_year() -> u32 {
+    *CURRENT_YEAR
+}
+
+fn compute_current_year() -> u32 {
     let now = SystemTime::now();
     let seconds_since_epoch = now
         .duration_since(UNIX_EPOCH)
@@ -76,6 +87,9 @@ where
 
 /// Writes pretty-formatted JSON data to a file, creating the file if it does not exist.
 ///
+/// The data is serialized straight into a buffered file writer, without building
+/// an intermediate string.
+///
 /// # Arguments
 ///
 /// * `file_path` - The path to the file where JSON data will be written.
@@ -85,10 +99,10 @@ where
 ///
 /// Returns an error if there are issues creating or writing to the file.
 pub fn write_json<P: AsRef<Path>>(file_path: P, json_data: &serde_json::Value) -> Result<()> {
-    let mut file = File::create(&file_path)?;
-    let json_string = serde_json::to_string_pretty(json_data)?;
-    file.write_all(json_string.as_bytes())?;
-    file.flush()?;
+    let file = File::create(&file_path)?;
+    let mut writer = BufWriter::new(file);
+    serde_json::to_writer_pretty(&mut writer, json_data)?;
+    writer.flush()?;
     Ok(())
 }
 
@@ -111,15 +125,11 @@ pub fn resolve_any_path<P>(path: P, filenames: &[&str]) -> Option<PathBuf>
 where
     P: AsRef<Path>,
 {
-    let mut out_path: Option<PathBuf> = None;
-    filenames.iter().for_each(|filename: &&str| {
-        let file_path = path.as_ref().join(filename);
-        if file_path.exists() {
-            let _ = out_path.insert(file_path);
-        }
-    });
-
-    out_path
+    // Stop at the first match instead of joining and probing every filename.
+    filenames
+        .iter()
+        .map(|filename| path.as_ref().join(filename))
+        .find(|file_path| file_path.exists())
 }
 
 #[cfg(test)]
@@ -36,11 +36,8 @@ where
         return false; // Year must be 4 digits
     }
 
-    let digits: Vec<char> = input.chars().collect();
-    for digit in digits {
-        if !digit.is_ascii_digit() {
-            return false; // Year must only contain digits
-        }
+    if !input.bytes().all(|b| b.is_ascii_digit()) {
+        return false; // Year must only contain digits
     }
 
     // Assume parse succeeds
@@ -88,6 +85,15 @@ mod tests {
         assert_eq!(acceptable_year(&current_year.to_string()), Ok(current_year));
     }
 
+    #[test]
+    fn valid_year_format() {
+        assert!(is_valid_year("2024"));
+        assert!(is_valid_year(1999));
+        assert!(!is_valid_year("20a4"));
+        assert!(!is_valid_year("202"));
+        assert!(!is_valid_year("２０２４"));
+    }
+
     #[test]
     fn invalid_non_numeric_input() {
         assert_eq!(
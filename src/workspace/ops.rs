@@ -30,7 +30,8 @@ use serde::{Deserialize, Serialize};
 use serde_json::{Map, Value};
 
 use std::borrow::Borrow;
-use std::fs::{self};
+use std::fs::{self, File};
+use std::io::{BufWriter, Write};
 use std::path::{Path, PathBuf};
 
 /// Find a Licensa configuration file in the directory specified by `workspace_root`.
@@ -81,14 +82,16 @@ where
     ensure_dir(workspace_root)?;
 
     let file_path = workspace_root.join(file_name.as_ref());
-    if !file_path.exists() {
+
+    // A single stat answers both the existence and the file type check
+    let Ok(metadata) = fs::metadata(&file_path) else {
         let err = WorkspaceError::Generic(
             anyhow!("path does not exist: {}", file_path.display())
                 .context("failed to read workspace config file"),
         );
         return Err(err);
-    }
-    if !file_path.is_file() {
+    };
+    if !metadata.is_file() {
         let err = WorkspaceError::Generic(
             anyhow!("{} is not a file", file_path.display())
                 .context("failed to read workspace config file"),
@@ -203,10 +206,16 @@ where
     }
 
     let config = remove_null_fields(config);
-    let config = serde_json::to_string_pretty(&config)
-        .with_context(|| "failed to serialize .licensarc config file")?;
     let out_path = workspace_root.join(file_name.as_ref());
-    fs::write(out_path, config).with_context(|| "failed to save .licensarc config file")?;
+    let file = File::create(out_path).with_context(|| "failed to save .licensarc config file")?;
+
+    // Serialize straight into the file instead of building an intermediate string
+    let mut writer = BufWriter::new(file);
+    serde_json::to_writer_pretty(&mut writer, &config)
+        .with_context(|| "failed to serialize .licensarc config file")?;
+    writer
+        .flush()
+        .with_context(|| "failed to save .licensarc config file")?;
 
     Ok(())
 }
@@ -307,7 +316,7 @@ where
     F: AsRef<str>,
 {
     let path = workspace_root.as_ref().join(file_name.as_ref());
-    path.exists() && path.is_file()
+    path.is_file()
 }
 
 /// Recursively removes all fields with `null` values from a JSON object.
@@ -328,7 +337,7 @@ where
 ///
 /// ```no_run,ignore
 /// use serde_json::{json, Value};
-/// use licensa::ops::workspace::remove_null_fields;
+/// use licensa::workspace::ops::remove_null_fields;
 ///
 /// let json_value = json!({
 ///     "name": "John",
@@ -350,7 +359,7 @@ where
 ///     "scores": [10, null, 20]
 /// }));
 /// ```
-fn remove_null_fields(value: Value) -> Value {
+pub fn remove_null_fields(value: Value) -> Value {
     match value {
         Value::Null => Value::Null,
         Value::Bool(_) => value,
@@ -407,6 +416,15 @@ mod tests {
             },
         );
         assert!(result.is_ok());
+
+        // Saved config must be pretty-printed JSON
+        let saved_content = fs::read_to_string(dir.as_ref().join("conf.toml")).unwrap();
+        let expected_content = serde_json::to_string_pretty(&json!({
+            "prop1": "This prop has no meaning",
+            "prop2": 23,
+        }))
+        .unwrap();
+        assert_eq!(saved_content, expected_content);
     }
 
     #[test]
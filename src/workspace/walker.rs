@@ -12,6 +12,7 @@ use ignore::{DirEntry, WalkBuilder as InternalWalkBuilder, WalkParallel, WalkSta
 use std::ffi::OsStr;
 use std::path::{Path, PathBuf};
 use std::sync::Arc;
+use std::thread::{self, JoinHandle};
 
 /// Represents the result of visiting a directory entry during the walk.
 ///
@@ -23,7 +24,7 @@ pub type WalkResult = Result<DirEntry, ignore::Error>;
 /// the walk should proceed.
 pub type FnVisitor<'s> = Box<dyn FnMut(WalkResult) -> WalkState + Send + 's>;
 
-type WalkPredicate = Arc<dyn Fn(WalkResult) -> bool + Send + Sync + 'static>;
+type WalkPredicate = Arc<dyn Fn(&WalkResult) -> bool + Send + Sync + 'static>;
 
 /// Represents a workspace walker.
 ///
@@ -57,22 +58,44 @@ impl Walk {
     /// Starts the walk asynchronously and returns a receiver for collecting [WalkResult]s.
     pub fn run_task(self) -> Receiver<WalkResult> {
         let (tx, rx) = self.chan::<WalkResult>();
+        self.send_results(tx);
+        rx
+    }
+
+    /// Starts the walk on a background thread and returns a receiver for collecting
+    /// [WalkResult]s right away, along with the handle of the walk thread.
+    ///
+    /// Unlike [Walk::run_task], which returns once the whole directory tree has been
+    /// visited, this allows consumers to process entries while the walk is in progress,
+    /// instead of after the whole tree was scanned.
+    ///
+    /// The receiver is closed when the walk finishes or the walk thread panics. Join
+    /// the handle once the receiver has been drained, so that a panic during the walk
+    /// is not mistaken for a completed walk.
+    pub fn spawn_task(self) -> (Receiver<WalkResult>, JoinHandle<()>) {
+        let (tx, rx) = self.chan::<WalkResult>();
+        let handle = thread::spawn(move || self.send_results(tx));
+        (rx, handle)
+    }
+
+    /// Runs the walk to completion, sending matching [WalkResult]s through `tx`.
+    fn send_results(self, tx: Sender<WalkResult>) {
         self.inner.run(|| {
             let tx = tx.clone();
             let quit_fn = self.quit_while.clone();
             let send_fn = self.send_while.clone();
             Box::new(move |result| {
-                if quit_fn(result.clone()) {
+                // Predicates only inspect the entry, so it is moved into the
+                // channel without being cloned
+                if quit_fn(&result) {
                     return WalkState::Quit;
                 }
-                if send_fn(result.clone()) {
-                    tx.send(result.clone()).unwrap();
+                if send_fn(&result) {
+                    tx.send(result).unwrap();
                 }
                 WalkState::Continue
             })
         });
-
-        rx
     }
 
     /// Sets a condition (closure) for deciding when to send directory entries
@@ -80,7 +103,7 @@ impl Walk {
     #[inline]
     pub fn send_while<T>(&mut self, when: T) -> &mut Self
     where
-        T: Fn(WalkResult) -> bool + Sync + Send + 'static,
+        T: Fn(&WalkResult) -> bool + Sync + Send + 'static,
     {
         self.send_while = Arc::new(when);
         self
@@ -90,7 +113,7 @@ impl Walk {
     #[inline]
     pub fn quit_while<T>(&mut self, when: T) -> &mut Self
     where
-        T: Fn(WalkResult) -> bool + Sync + Send + 'static,
+        T: Fn(&WalkResult) -> bool + Sync + Send + 'static,
     {
         self.quit_while = Arc::new(when);
         self
@@ -415,8 +438,9 @@ mod tests {
             .build()
             .expect("Failed to build workspace walk");
 
-        let filter_file = |res: Result<DirEntry, ignore::Error>| {
-            res.is_ok() && res.unwrap().file_type().unwrap().is_file()
+        let filter_file = |res: &WalkResult| {
+            res.as_ref()
+                .is_ok_and(|entry| entry.file_type().unwrap().is_file())
         };
 
         // Only include files
@@ -456,6 +480,28 @@ mod tests {
         assert!(entries.len() == 2);
     }
 
+    #[test]
+    fn test_workspace_walk_spawn_task() {
+        let (tmp_dir, file_path) = create_temp_file("somefile.rs");
+        let builder = WalkBuilder::new(&tmp_dir);
+        let mut walker = builder.build().expect("Failed to build workspace walk");
+
+        // Only include files
+        walker.send_while(|res| {
+            res.as_ref()
+                .is_ok_and(|entry| entry.file_type().unwrap().is_file())
+        });
+
+        let (rx, handle) = walker.spawn_task();
+        let entries: Vec<DirEntry> = rx.into_iter().filter_map(Result::ok).collect();
+        assert!(handle.join().is_ok());
+
+        assert!(entries.len() == 1);
+
+        drop(file_path);
+        tmp_dir.close().unwrap();
+    }
+
     #[test]
     fn test_workspace_walk_quit_while() {
         let (tmp_dir, builder) = create_test_builder();